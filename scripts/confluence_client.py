@@ -7,12 +7,17 @@ from atlassian import Confluence
 from dotenv import load_dotenv
 import html2text
 import os
-from docx import Document
-from PyPDF2 import PdfReader
-from openpyxl import load_workbook
-import io
+try:
+    import httpx
+except ImportError:
+    httpx = None
 import json
+import re
 import requests
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import sys
 from typing import Dict, Any
@@ -31,6 +36,15 @@ SUPPORTED_TEXT_EXTS = (".txt", ".json", ".pdf", ".docx", ".xlsx")
 DRAWIO_MIME = "application/vnd.jgraph.mxfile"
 DRAWIO_EXTS = (".drawio",)
 IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp")
+# Single compiled prefix matcher instead of a Python-level any()/startswith loop
+_SUPPORTED_CT_RE = re.compile(
+    "^(?:" + "|".join(re.escape(ct) for ct in SUPPORTED_TEXT_TYPES) + ")"
+)
+
+# PDFium is not thread-safe, even across independent documents, so every
+# call into it is serialized; concurrent page recursion can reach the PDF
+# parser from several threads at once
+_PDFIUM_LOCK = threading.Lock()
 
 # Logging configuration
 logging.basicConfig(
@@ -53,11 +67,67 @@ class ConfluenceClient:
         self.url = os.getenv("CONFLUENCE_URL")
         self.api_token = os.getenv("CONFLUENCE_ACCESS_TOKEN")
         self.recursive_depth = int(os.getenv("CONFLUENCE_RECURSIVE_DEPTH", "1"))
+        # 0 disables the size cap
+        self.max_attachment_bytes = int(
+            os.getenv("CONFLUENCE_MAX_ATTACHMENT_BYTES", "0")
+        )
         if not self.url or not self.api_token:
             raise ValueError(
                 "❌ Missing CONFLUENCE_URL or CONFLUENCE_ACCESS_TOKEN in environment variables."
             )
         self.confluence = Confluence(url=self.url, token=self.api_token)
+        # Reuse one pooled client for attachment downloads instead of a new
+        # TCP/TLS handshake per attachment. Prefer httpx with HTTP/2 so the
+        # parallel fan-out multiplexes streams over one connection; fall back
+        # to a pooled requests.Session when httpx or h2 is unavailable.
+        self.session = None
+        self._use_httpx = False
+        if httpx is not None:
+            try:
+                self.session = httpx.Client(
+                    http2=True,
+                    headers={"Authorization": f"Bearer {self.api_token}"},
+                    timeout=30.0,
+                    limits=httpx.Limits(
+                        max_connections=32, max_keepalive_connections=16
+                    ),
+                )
+                self._use_httpx = True
+            except ImportError:
+                # httpx installed without the h2 extra
+                self.session = None
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.headers.update(
+                {"Authorization": f"Bearer {self.api_token}"}
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=10, pool_maxsize=32, max_retries=3
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        # Shared pool for fanning out sibling page recursion; the semaphore
+        # bounds in-flight recursive tasks so deep trees fall back to inline
+        # recursion instead of exhausting (and deadlocking) the pool.
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._recursion_slots = threading.BoundedSemaphore(8)
+        self._page_cache: Dict[str, Dict[str, Any]] = {}
+        # HTML2Text instances are not thread-safe, so keep one per thread
+        # instead of rebuilding a converter on every call.
+        self._h2t_local = threading.local()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session and shut down the recursion executor.
+        """
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> "ConfluenceClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def get_confluence_details(self, page_title: str) -> str:
         """
@@ -66,41 +136,90 @@ class ConfluenceClient:
         :return: Markdown string with page content and attachment details
         """
         page = self._get_page_by_title(page_title)
-        markdown = html2text.html2text(page["body"]["storage"]["value"])
+        parts = [self._html_to_markdown(page["body"]["storage"]["value"])]
         attachments = self._get_attachments_and_parse(page)
         if attachments:
-            markdown += f"\n\n# Attachments (Total: {len(attachments)})\n"
+            parts.append(f"\n\n# Attachments (Total: {len(attachments)})\n")
             for fname, content in attachments.items():
-                markdown += f"\n## {fname}\n\n```\n{content}\n```\n"
-        return markdown
+                parts.append(f"\n## {fname}\n\n```\n{content}\n```\n")
+        return "".join(parts)
 
     def get_confluence_details_recursive(
-        self, page_title: str, depth: int = None, current_level: int = 0
+        self,
+        page_title: str,
+        depth: int = None,
+        current_level: int = 0,
+        page_id: str = None,
     ) -> str:
         if depth is None:
             depth = self.recursive_depth
-        page = self._get_page_by_title(page_title)
-        markdown = f"{'#' * (current_level + 1)} {page_title}\n"
-        markdown += html2text.html2text(page["body"]["storage"]["value"])
+        if page_id:
+            page = self._get_page_by_id(page_id)
+        else:
+            page = self._get_page_by_title(page_title)
+        parts = [f"{'#' * (current_level + 1)} {page_title}\n"]
+        parts.append(self._html_to_markdown(page["body"]["storage"]["value"]))
         attachments = self._get_attachments_and_parse(page)
         if attachments:
-            markdown += f"\n\n## Attachments (Total: {len(attachments)})\n"
+            parts.append(f"\n\n## Attachments (Total: {len(attachments)})\n")
             for fname, content in attachments.items():
-                markdown += f"\n### {fname}\n\n```\n{content}\n```\n"
+                parts.append(f"\n### {fname}\n\n```\n{content}\n```\n")
         if current_level < depth - 1:
             child_pages = self._get_child_pages(page["id"])
-            for child in child_pages:
-                child_title = child["title"]
-                markdown += "\n" + self.get_confluence_details_recursive(
-                    child_title, depth, current_level + 1
-                )
-        return markdown
+            results = [
+                self._recurse_child(child_title, depth, current_level + 1, child_id)
+                for child_id, child_title in child_pages
+            ]
+            for result in results:
+                parts.append("\n")
+                parts.append(result.result() if isinstance(result, Future) else result)
+        return "".join(parts)
+
+    def _recurse_child(self, child_title: str, depth: int, level: int, child_id: str):
+        """
+        Recurse into a child page on the shared executor when a slot is free,
+        falling back to inline recursion otherwise.
+        :param child_title: Title of the child page
+        :param depth: Maximum recursion depth
+        :param level: Recursion level of the child
+        :param child_id: Page id of the child, so recursion skips title lookup
+        :return: Future or markdown string for the child subtree
+        """
+        if self._recursion_slots.acquire(blocking=False):
+
+            def task():
+                try:
+                    return self.get_confluence_details_recursive(
+                        child_title, depth, level, page_id=child_id
+                    )
+                finally:
+                    self._recursion_slots.release()
+
+            return self._executor.submit(task)
+        return self.get_confluence_details_recursive(
+            child_title, depth, level, page_id=child_id
+        )
+
+    def _html_to_markdown(self, html: str) -> str:
+        """
+        Convert Confluence storage HTML to markdown with a cached per-thread
+        HTML2Text converter.
+        :param html: HTML string from the page body
+        :return: Markdown string
+        """
+        h2t = getattr(self._h2t_local, "h2t", None)
+        if h2t is None:
+            h2t = html2text.HTML2Text()
+            h2t.body_width = 0  # skip the O(n) line-wrapping pass
+            h2t.ignore_images = True
+            self._h2t_local.h2t = h2t
+        return h2t.handle(html)
 
     def _get_child_pages(self, page_id: str) -> list:
         children = self.confluence.get_child_content(page_id, type="page").get(
             "results", []
         )
-        return children
+        return [(child["id"], child["title"]) for child in children]
 
     def _get_page_by_title(self, page_title: str) -> Dict[str, Any]:
         """
@@ -117,6 +236,21 @@ class ConfluenceClient:
             )
         return page
 
+    def _get_page_by_id(self, page_id: str) -> Dict[str, Any]:
+        """
+        Fetch a Confluence page by its id, memoized across recursive calls.
+        :param page_id: The id of the Confluence page
+        :return: Page dictionary
+        """
+        page = self._page_cache.get(page_id)
+        if page is not None:
+            return page
+        page = self.confluence.get_page_by_id(page_id, expand="body.storage")
+        if not page or "body" not in page or "storage" not in page["body"]:
+            raise ValueError(f"❌ Could not fetch content for page id '{page_id}'")
+        self._page_cache[page_id] = page
+        return page
+
     def _get_attachments_and_parse(self, page: Dict[str, Any]) -> Dict[str, str]:
         """
         Download and parse all attachments for a given Confluence page.
@@ -130,111 +264,243 @@ class ConfluenceClient:
             "results", []
         )
         parsed = {}
+        downloadable = []
         for att in attachments:
             filename = att["title"]
+            lower_name = filename.lower()
             # Skip download for images/binaries by extension and temp draw.io files
-            if filename.lower().endswith(IMAGE_EXTS) or filename.lower().endswith(
-                ".tmp"
-            ):
+            if lower_name.endswith(IMAGE_EXTS) or lower_name.endswith(".tmp"):
                 logging.info(f"Skipping image or temp file: {filename}")
                 parsed[filename] = "[File not displayed: image or temp file omitted]"
                 continue
-            download_link = att["_links"]["download"]
-            url = self.url.rstrip("/") + download_link
-            headers = {"Authorization": f"Bearer {self.api_token}"}
-            try:
-                response = requests.get(url, headers=headers)
-                file_content = response.content
-                content_type = response.headers.get("Content-Type", "").lower().strip()
-            except Exception as e:
-                logging.warning(f"❌ Failed to download {filename}: {e}")
-                parsed[filename] = f"❌ [Download error: {e}]"
-                continue
-            # Now check content type and process
-            if self._is_drawio(filename, content_type):
-                xml_str = file_content.decode("utf-8", errors="replace")
-                parsed[filename] = (
+            downloadable.append(att)
+        if downloadable:
+            # Overlap the per-attachment downloads; the pooled session keeps
+            # pool_maxsize >= max_workers so they run on parallel connections.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for filename, content in executor.map(
+                    self._fetch_and_parse_one, downloadable
+                ):
+                    parsed[filename] = content
+        return parsed
+
+    def _fetch_and_parse_one(self, att: Dict[str, Any]) -> tuple:
+        """
+        Download and parse a single attachment.
+        :param att: Attachment dictionary from the Confluence API
+        :return: Tuple of (filename, extracted or parsed content)
+        """
+        filename = att["title"]
+        lower_name = filename.lower()
+        download_link = att["_links"]["download"]
+        url = self.url.rstrip("/") + download_link
+        # Decide from metadata (or a HEAD probe) before paying for the body
+        probed_type, file_size = self._probe_attachment(att, url)
+        if (
+            self.max_attachment_bytes
+            and file_size
+            and file_size > self.max_attachment_bytes
+        ):
+            logging.warning(
+                f"Skipping oversized attachment: {filename} ({file_size} bytes)"
+            )
+            return filename, (
+                f"[Attachment skipped: {file_size} bytes exceeds "
+                f"{self.max_attachment_bytes} byte limit]"
+            )
+        if probed_type and not (
+            self._is_drawio(lower_name, probed_type)
+            or self._is_supported_text(lower_name, probed_type)
+        ):
+            logging.warning(
+                f"Skipping unsupported file without download: {filename} ({probed_type})"
+            )
+            return filename, f"[File type not parsed: {probed_type}]"
+        try:
+            content_type, file_obj = self._download_to_file(url)
+        except Exception as e:
+            logging.warning(f"❌ Failed to download {filename}: {e}")
+            return filename, f"❌ [Download error: {e}]"
+        # Now check content type and process
+        try:
+            if self._is_drawio(lower_name, content_type):
+                xml_str = file_obj.read().decode("utf-8", errors="replace")
+                return filename, (
                     "Refer the attached the Draw.io XML content : \n " + xml_str
                 )
-            elif self._is_supported_text(filename, content_type):
-                parsed[filename] = self._extract_text_from_attachment(
-                    filename, file_content
+            elif self._is_supported_text(lower_name, content_type):
+                return filename, self._extract_text_from_attachment(
+                    lower_name, file_obj
                 )
             else:
                 logging.warning(
                     f"Skipping unsupported file after download: {filename} ({content_type or 'unknown'})"
                 )
-                parsed[filename] = (
-                    f'[File type not parsed: {content_type or "unknown"}]'
+                return filename, f'[File type not parsed: {content_type or "unknown"}]'
+        finally:
+            file_obj.close()
+
+    def _download_to_file(self, url: str) -> tuple:
+        """
+        Stream an attachment into a spooled temp file: small attachments stay
+        in memory, large ones spill to disk instead of doubling in RAM.
+        :param url: Download URL for the attachment
+        :return: Tuple of (content type, file object positioned at the start)
+        """
+        file_obj = tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+        if self._use_httpx:
+            with self.session.stream("GET", url) as response:
+                content_type = (
+                    response.headers.get("Content-Type", "").lower().strip()
+                )
+                for chunk in response.iter_bytes():
+                    file_obj.write(chunk)
+        else:
+            with self.session.get(url, stream=True, timeout=60) as response:
+                content_type = (
+                    response.headers.get("Content-Type", "").lower().strip()
                 )
-        return parsed
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, file_obj)
+        file_obj.seek(0)
+        return content_type, file_obj
+
+    def _probe_attachment(self, att: Dict[str, Any], url: str) -> tuple:
+        """
+        Determine an attachment's content type and size without downloading it.
+        Prefers the mediaType/fileSize fields the attachments API already
+        returns; falls back to a HEAD request for Confluence versions that
+        omit them.
+        :param att: Attachment dictionary from the Confluence API
+        :param url: Download URL for the attachment
+        :return: Tuple of (content type or empty string, size in bytes or None)
+        """
+        media_type = att.get("metadata", {}).get("mediaType")
+        file_size = att.get("extensions", {}).get("fileSize")
+        if media_type is None:
+            try:
+                if self._use_httpx:
+                    response = self.session.head(url, follow_redirects=True)
+                else:
+                    response = self.session.head(
+                        url, allow_redirects=True, timeout=30
+                    )
+                media_type = response.headers.get("Content-Type")
+                if file_size is None:
+                    content_length = response.headers.get("Content-Length")
+                    file_size = int(content_length) if content_length else None
+            except Exception as e:
+                logging.warning(f"HEAD probe failed for {att['title']}: {e}")
+        return (media_type or "").lower().strip(), file_size
 
     def _is_drawio(self, filename: str, content_type: str) -> bool:
         """
         Check if a file is a draw.io diagram based on filename or content type.
-        :param filename: Filename
+        :param filename: Lowercased filename
         :param content_type: Content type string
         :return: True if draw.io, else False
         """
         return (
             content_type.startswith(DRAWIO_MIME)
             or filename.endswith(DRAWIO_EXTS)
-            or (filename.endswith(".xml") and "drawio" in filename.lower())
+            or (filename.endswith(".xml") and "drawio" in filename)
         )
 
     def _is_supported_text(self, filename: str, content_type: str) -> bool:
         """
         Check if a file is a supported text type.
-        :param filename: Filename
+        :param filename: Lowercased filename
         :param content_type: Content type string
         :return: True if supported text, else False
         """
-        return any(
-            content_type.startswith(ct) for ct in SUPPORTED_TEXT_TYPES
-        ) or filename.lower().endswith(SUPPORTED_TEXT_EXTS)
+        return bool(_SUPPORTED_CT_RE.match(content_type)) or filename.endswith(
+            SUPPORTED_TEXT_EXTS
+        )
 
-    def _extract_text_from_attachment(self, filename: str, raw_content: bytes) -> str:
+    def _extract_text_from_attachment(self, filename: str, file_obj: Any) -> str:
         """
         Extract text from an attachment based on file extension.
-        :param filename: Filename
-        :param raw_content: Raw file bytes
+        :param filename: Lowercased filename
+        :param file_obj: File-like object positioned at the start of the data
         :return: Extracted text or a message for unsupported types
         """
-        filename = filename.lower()
         if filename.endswith(
             (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp")
         ):
             return "[Image file: not displayed, binary content omitted]"
         elif filename.endswith(".xlsx"):
-            wb = load_workbook(io.BytesIO(raw_content), data_only=True)
-            text = []
-            for sheet in wb.worksheets:
-                for row in sheet.iter_rows(values_only=True):
-                    text.append(
-                        "\t".join(
-                            [str(cell) if cell is not None else "" for cell in row]
+            # Imported lazily so CLI startup doesn't pay for parsers the
+            # target page never needs (sys.modules caches repeat calls)
+            from openpyxl import load_workbook
+
+            # read_only streams rows with constant memory instead of
+            # materializing every cell object
+            wb = load_workbook(file_obj, data_only=True, read_only=True)
+
+            def rows_iter():
+                for sheet in wb.worksheets:
+                    for row in sheet.iter_rows(values_only=True):
+                        yield "\t".join(
+                            "" if cell is None else str(cell) for cell in row
                         )
-                    )
-            return "\n".join(text)
+
+            try:
+                return "\n".join(rows_iter())
+            finally:
+                wb.close()
         elif filename.endswith(".docx"):
-            doc = Document(io.BytesIO(raw_content))
+            from docx import Document
+
+            doc = Document(file_obj)
             return "\n".join([para.text for para in doc.paragraphs])
         elif filename.endswith(".pdf"):
-            reader = PdfReader(io.BytesIO(raw_content))
+            try:
+                import pypdfium2 as pdfium
+            except ImportError:
+                pdfium = None
+            if pdfium is not None:
+                return self._extract_pdf_text(file_obj.read())
+            from PyPDF2 import PdfReader
+
+            reader = PdfReader(file_obj)
             text = []
             for page in reader.pages:
                 text.append(page.extract_text() or "")
             return "\n".join(text)
         elif filename.endswith(".json"):
+            raw_content = file_obj.read()
             try:
                 data = json.loads(raw_content.decode(errors="replace"))
                 return json.dumps(data, indent=2)
             except Exception:
                 return raw_content.decode(errors="replace")
         elif filename.endswith(".txt"):
-            return raw_content.decode(errors="replace")
+            return file_obj.read().decode(errors="replace")
         else:
-            return raw_content.decode(errors="replace")[:100000]
+            return file_obj.read().decode(errors="replace")[:100000]
+
+    def _extract_pdf_text(self, data: bytes) -> str:
+        """
+        Extract text from a PDF with pypdfium2. Pages are read sequentially:
+        PDFium itself is not thread-safe, even across independent document
+        handles, so page-level fan-out is not an option.
+        :param data: Raw PDF bytes
+        :return: Extracted text
+        """
+        import pypdfium2 as pdfium
+
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                texts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    texts.append(textpage.get_text_bounded())
+                    textpage.close()
+                    page.close()
+                return "\n".join(texts)
+            finally:
+                pdf.close()
 
 
 def main() -> None:
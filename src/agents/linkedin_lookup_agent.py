@@ -1,3 +1,5 @@
+import functools
+
 from dotenv import load_dotenv
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.runnables import RunnableLambda
@@ -14,7 +16,9 @@ from langchain.agents import AgentExecutor
 from langchain.agents.react.agent import create_react_agent
 
 
-def lookup() -> str:
+@functools.lru_cache(maxsize=1)
+def _build_chain():
+    """Build the model, agent and parsing chain once; lookups reuse it."""
     llm = ChatOllama(
         temperature=0, model="llama3.2:latest", base_url="http://localhost:11434"
     )
@@ -25,14 +29,19 @@ def lookup() -> str:
         input_variables=["input", "agent_scratchpad", "tool_names"],
     ).partial(format_instructions=output_parser.get_format_instructions())
 
+    tools = get_tools()
     agent = create_react_agent(
-        llm=llm, tools=get_tools(), prompt=react_prompt_with_format_instructions
+        llm=llm, tools=tools, prompt=react_prompt_with_format_instructions
     )
-    agent_executor = AgentExecutor(agent=agent, tools=get_tools(), verbose=True)
+    agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
     extract_output = RunnableLambda(lambda x: x["output"])
     parse_output = RunnableLambda(lambda x: output_parser.parse(x))
 
-    chain = agent_executor | extract_output | parse_output
+    return agent_executor | extract_output | parse_output
+
+
+def lookup() -> str:
+    chain = _build_chain()
 
     result = chain.invoke(
         input={
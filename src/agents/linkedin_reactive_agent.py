@@ -25,10 +25,11 @@ def lookup() -> str:
         input_variables=["input", "agent_scratchpad", "tool_names"],
     ).partial(format_instructions=output_parser.get_format_instructions())
 
+    tools = get_tools()
     agent = create_react_agent(
-        llm=llm, tools=get_tools(), prompt=react_prompt_with_format_instructions
+        llm=llm, tools=tools, prompt=react_prompt_with_format_instructions
     )
-    agent_executor = AgentExecutor(agent=agent, tools=get_tools(), verbose=True)
+    agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
     extract_output = RunnableLambda(lambda x: x["output"])
     parse_output = RunnableLambda(lambda x: output_parser.parse(x))
 
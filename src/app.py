@@ -1,5 +1,3 @@
-from pprint import pprint
-
 from dotenv import load_dotenv
 from langchain.prompts.prompt import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -21,9 +19,14 @@ def crack_joke(topic: str) -> str:
     )
 
     chain = joke_prompt | model | StrOutputParser()
-    res = chain.invoke(input={"information": topic})
-
-    pprint(res)
+    # Stream chunks as they arrive so output starts at the first token
+    # instead of after the whole generation
+    parts = []
+    for chunk in chain.stream({"information": topic}):
+        print(chunk, end="", flush=True)
+        parts.append(chunk)
+    print()
+    return "".join(parts)
 
 
 if __name__ == "__main__":
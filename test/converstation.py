@@ -1,31 +1,46 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_ollama import ChatOllama
 
 
+@functools.lru_cache(maxsize=8)
 def implement_model(model_name):
+    # Cached per model name so repeated comparisons reuse the warmed
+    # HTTP session instead of rebuilding the client
     return ChatOllama(
         model=model_name, temperature=0.7, base_url="http://localhost:11434"
     )
 
 
-def implement_stream_query_model(model, prompt):
+def implement_stream_query_model(model, prompt, echo=True):
     response_stream = model.stream([{"role": "user", "content": prompt}])
-    content = ""
+    parts = []
     for chunk in response_stream:
-        print(chunk.content, end="", flush=True)
-        content += chunk.content
-    print()
-    return content
+        if echo:
+            print(chunk.content, end="", flush=True)
+        parts.append(chunk.content)
+    if echo:
+        print()
+    return "".join(parts)
 
 
 def implement_compare_models_streaming(test_prompt):
     gemma3 = implement_model("gemma3:1b")
     phi3 = implement_model("phi3:mini")
-    print("🌐Streaming gemma3:1b response:")
-    response_gemma3 = implement_stream_query_model(gemma3, test_prompt)
-    print()
-    print("🌐Streaming phi3:mini response:")
-    response_phi3 = implement_stream_query_model(phi3, test_prompt)
-    print()
+    # Run both generations concurrently: gemma3 streams to the console live
+    # while phi3 accumulates in the background and prints when done
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_phi3 = executor.submit(
+            implement_stream_query_model, phi3, test_prompt, False
+        )
+        print("🌐Streaming gemma3:1b response:")
+        response_gemma3 = implement_stream_query_model(gemma3, test_prompt)
+        print()
+        print("🌐Streaming phi3:mini response:")
+        response_phi3 = future_phi3.result()
+        print(response_phi3)
+        print()
     return {"gemma3:1b": response_gemma3, "phi3:mini": response_phi3}
 
 